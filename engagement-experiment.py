@@ -1,26 +1,29 @@
 import happybase
 from collections import defaultdict
 
-connection = happybase.Connection('localhost')
+connection = happybase.Connection('localhost', transport='framed', protocol='compact')
 table = connection.table('social_media')
 
-platform_totals = defaultdict(float)
-platform_counts = defaultdict(int)
+PLATFORM_COL = b'cf:Platform'
+ENGAGEMENT_COL = b'cf:Engagement Rate'
 
-for key, data in table.scan():
-    platform = data.get(b'cf:Platform')
-    engagement = data.get(b'cf:Engagement Rate')
-    
-    if platform and engagement:
-        platform_str = platform.decode('utf-8')
-        try:
-            engagement_value = float(engagement.decode('utf-8'))
-            platform_totals[platform_str] += engagement_value
-            platform_counts[platform_str] += 1
-        except ValueError:
-            continue
+# Keyed by raw platform bytes; decoded only once when printing.
+# Each entry is [engagement total, row count], updated in place.
+platform_stats = defaultdict(lambda: [0.0, 0])
+
+for _, data in table.scan(batch_size=5000, columns=[PLATFORM_COL, ENGAGEMENT_COL]):
+    try:
+        platform = data[PLATFORM_COL]
+        engagement_value = float(data[ENGAGEMENT_COL])
+    except (KeyError, ValueError):
+        continue
+    if not platform:
+        continue
+    stats = platform_stats[platform]
+    stats[0] += engagement_value
+    stats[1] += 1
 
 print("Average Engagement Rate per Platform:")
-for platform in platform_totals:
-    avg = platform_totals[platform] / platform_counts[platform]
-    print(f"{platform}: {avg:.2f}")
\ No newline at end of file
+for platform, (total, count) in platform_stats.items():
+    avg = total / count
+    print(f"{platform.decode('utf-8')}: {avg:.2f}")
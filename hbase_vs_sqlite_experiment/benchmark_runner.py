@@ -1,5 +1,6 @@
 import time
 import json
+import numpy as np
 from hbase_loader import OptimizedHBaseLoader
 from sqlite_loader import BasicSQLiteLoader
 
@@ -8,23 +9,59 @@ SQLITE_TABLE = 'social_media'
 HBASE_TABLE = 'social_media_optimized'
 RESULTS_FILE = 'benchmark_results.json'
 
+SHARED_SCAN_COLUMNS = [b'cf:platform', b'cf:post_id', b'metrics:likes', b'metrics:engagement_rate']
+
+# Server-side scanner filters (HBase filter language). Metrics are stored as
+# ASCII decimals, so only string predicates are pushed down; numeric ranges
+# are still checked client-side on the reduced result set. Filtered scans stop
+# at the end of the first 1000 rows instead of using limit=1000, which would
+# keep scanning until 1000 rows match.
+POSITIVE_SENTIMENT_FILTER = "SingleColumnValueFilter('cf', 'sentiment', =, 'binary:Positive', true, true)"
+MALE_AUDIENCE_FILTER = "SingleColumnValueFilter('cf', 'audience_gender', =, 'binary:Male', true, true)"
+LATE_TIMESTAMP_FILTER = "SingleColumnValueFilter('cf', 'post_timestamp', >, 'binary:30:00.0', true, true)"
+# Counting only needs row keys: with the scan narrowed to cf:sentiment,
+# FirstKeyOnlyFilter keeps that single cell and KeyOnlyFilter strips its value.
+NEGATIVE_SENTIMENT_FILTER = (
+    "SingleColumnValueFilter('cf', 'sentiment', =, 'binary:Negative', true, true)"
+    " AND FirstKeyOnlyFilter() AND KeyOnlyFilter()"
+)
+
+def parse_column(raw_values, dtype):
+    """Parse a list of ASCII-decimal HBase cells into a NumPy array in one call"""
+    return np.array(raw_values, dtype=bytes).astype(dtype)
+
+def group_codes(keys):
+    """Map each key to a dense group code: (distinct keys, NumPy code array)"""
+    index = {}
+    codes = np.fromiter([index.setdefault(key, len(index)) for key in keys], dtype=np.intp, count=len(keys))
+    return list(index), codes
+
 def benchmark_sqlite():
     loader = BasicSQLiteLoader(db_path=SQLITE_DB)
     loader.create_connection()
+    # Normally built by the loader; create_indexes also runs ANALYZE, so skip it when present
+    if not loader.has_indexes(SQLITE_TABLE):
+        loader.create_indexes(SQLITE_TABLE)
     conn = loader.connection
     cursor = conn.cursor()
+    # WAL, in-memory temp B-trees, the large page cache and mmap reads
+    # all come from create_connection
+    # Rows are streamed and discarded rather than materialized with fetchall()
     results = {}
 
     # Read
     t0 = time.time()
-    cursor.execute(f"SELECT * FROM {SQLITE_TABLE} LIMIT 1000")
-    _ = cursor.fetchall()
+    cursor.execute(f"SELECT platform, post_id, likes, engagement_rate FROM {SQLITE_TABLE} LIMIT 1000")
+    for _ in cursor:
+        pass
     results["read_time"] = round(time.time() - t0, 4)
 
-    # Aggregation
+    # Aggregation (this and the combined aggregation are timed as separate
+    # queries; both are answered from the platform/likes/engagement covering index)
     t0 = time.time()
     cursor.execute(f"SELECT platform, AVG(likes) FROM {SQLITE_TABLE} GROUP BY platform")
-    _ = cursor.fetchall()
+    for _ in cursor:
+        pass
     results["aggregation_time"] = round(time.time() - t0, 4)
 
     # Query
@@ -33,7 +70,8 @@ def benchmark_sqlite():
         SELECT * FROM {SQLITE_TABLE}
         WHERE likes > 800 AND sentiment = 'Positive'
     """)
-    _ = cursor.fetchall()
+    for _ in cursor:
+        pass
     results["query_time"] = round(time.time() - t0, 4)
 
     # Filtered Read
@@ -42,7 +80,8 @@ def benchmark_sqlite():
         SELECT * FROM {SQLITE_TABLE}
         WHERE likes BETWEEN 500 AND 1000 AND audience_gender = 'Male'
     """)
-    _ = cursor.fetchall()
+    for _ in cursor:
+        pass
     results["filtered_read_time"] = round(time.time() - t0, 4)
 
     # Range Aggregation
@@ -51,7 +90,7 @@ def benchmark_sqlite():
         SELECT AVG(engagement_rate) FROM {SQLITE_TABLE}
         WHERE post_timestamp > '30:00.0'
     """)
-    _ = cursor.fetchall()
+    _ = cursor.fetchone()
     results["range_aggregation_time"] = round(time.time() - t0, 4)
 
     # Top-N
@@ -60,7 +99,8 @@ def benchmark_sqlite():
         SELECT post_id, likes FROM {SQLITE_TABLE}
         ORDER BY likes DESC LIMIT 5
     """)
-    _ = cursor.fetchall()
+    for _ in cursor:
+        pass
     results["top_n_time"] = round(time.time() - t0, 4)
 
     # Combined Aggregation
@@ -70,7 +110,8 @@ def benchmark_sqlite():
         FROM {SQLITE_TABLE}
         GROUP BY platform
     """)
-    _ = cursor.fetchall()
+    for _ in cursor:
+        pass
     results["combined_aggregation_time"] = round(time.time() - t0, 4)
 
     # Count
@@ -79,7 +120,7 @@ def benchmark_sqlite():
         SELECT COUNT(*) FROM {SQLITE_TABLE}
         WHERE sentiment = 'Negative'
     """)
-    _ = cursor.fetchall()
+    _ = cursor.fetchone()
     results["count_negative_sentiment_time"] = round(time.time() - t0, 4)
 
     loader.cleanup()
@@ -94,79 +135,81 @@ def benchmark_hbase():
 
     table = loader.main_connection.table(HBASE_TABLE)
 
-    # Read
-    t0 = time.time()
-    for _, _ in table.scan(limit=1000):
-        pass
-    results["read_time"] = round(time.time() - t0, 4)
+    # Shared scan: read, aggregation, top-N and combined aggregation all work on
+    # the same unfiltered 1000 rows, so fetch them once. Text cells stay as raw
+    # bytes and numeric cells are parsed column-wise with NumPy. Each of those
+    # tasks reports the shared scan time plus the time of its own computation.
+    t0 = time.time()
+    platforms, post_ids, raw_likes, raw_rates = [], [], [], []
+    add_platform, add_post_id = platforms.append, post_ids.append
+    add_likes, add_rate = raw_likes.append, raw_rates.append
+    last_key = None
+    for last_key, data in table.scan(limit=1000, batch_size=1000, columns=SHARED_SCAN_COLUMNS):
+        get = data.get
+        add_platform(get(b'cf:platform', b'unknown'))
+        add_post_id(get(b'cf:post_id', b''))
+        add_likes(get(b'metrics:likes', b'0'))
+        add_rate(get(b'metrics:engagement_rate', b'0'))
+    likes = parse_column(raw_likes, np.int64)
+    rates = parse_column(raw_rates, np.float64)
+    scan_time = time.time() - t0
+    results["read_time"] = round(scan_time, 4)
+    # Exclusive stop key right after the 1000th row
+    first_rows_stop = last_key + b'\x00' if last_key is not None else None
 
     # Aggregation
     t0 = time.time()
-    platform_likes = {}
-    for _, data in table.scan(limit=1000):
-        platform = data.get(b'cf:platform', b'unknown').decode()
-        likes = int(data.get(b'metrics:likes', b'0'))
-        platform_likes.setdefault(platform, []).append(likes)
-    _ = {p: sum(vals)/len(vals) for p, vals in platform_likes.items() if vals}
-    results["aggregation_time"] = round(time.time() - t0, 4)
+    groups, codes = group_codes(platforms)
+    totals = np.bincount(codes, weights=likes, minlength=len(groups))
+    counts = np.bincount(codes, minlength=len(groups))
+    _ = dict(zip(groups, (totals / counts).tolist()))
+    results["aggregation_time"] = round(scan_time + time.time() - t0, 4)
 
     # Query
     t0 = time.time()
-    for _, data in table.scan(limit=1000):
-        likes = int(data.get(b'metrics:likes', b'0'))
-        sentiment = data.get(b'cf:sentiment', b'').decode().lower()
-        if likes > 800 and sentiment == 'positive':
-            pass
+    query_likes = parse_column([data.get(b'metrics:likes', b'0') for _, data in table.scan(
+        row_stop=first_rows_stop, columns=[b'metrics:likes', b'cf:sentiment'],
+        filter=POSITIVE_SENTIMENT_FILTER)], np.int64)
+    _ = np.count_nonzero(query_likes > 800)
     results["query_time"] = round(time.time() - t0, 4)
 
     # Filtered Read
     t0 = time.time()
-    for _, data in table.scan(limit=1000):
-        likes = int(data.get(b'metrics:likes', b'0'))
-        gender = data.get(b'cf:audience_gender', b'').decode()
-        if 500 <= likes <= 1000 and gender == 'Male':
-            pass
+    filtered_likes = parse_column([data.get(b'metrics:likes', b'0') for _, data in table.scan(
+        row_stop=first_rows_stop, columns=[b'metrics:likes', b'cf:audience_gender'],
+        filter=MALE_AUDIENCE_FILTER)], np.int64)
+    _ = np.count_nonzero((filtered_likes >= 500) & (filtered_likes <= 1000))
     results["filtered_read_time"] = round(time.time() - t0, 4)
 
     # Range Aggregation
     t0 = time.time()
-    rates = []
-    for _, data in table.scan(limit=1000):
-        timestamp = data.get(b'cf:post_timestamp', b'00:00.0').decode()
-        rate = float(data.get(b'metrics:engagement_rate', b'0'))
-        if timestamp > '30:00.0':
-            rates.append(rate)
-    _ = sum(rates) / len(rates) if rates else 0
+    range_rates = parse_column([data.get(b'metrics:engagement_rate', b'0') for _, data in table.scan(
+        row_stop=first_rows_stop, columns=[b'metrics:engagement_rate', b'cf:post_timestamp'],
+        filter=LATE_TIMESTAMP_FILTER)], np.float64)
+    _ = range_rates.mean() if range_rates.size else 0
     results["range_aggregation_time"] = round(time.time() - t0, 4)
 
-    # Top-N
+    # Top-N: partial partition instead of a full sort (post ids stay as raw bytes)
     t0 = time.time()
-    posts = []
-    for _, data in table.scan(limit=1000):
-        post_id = data.get(b'cf:post_id', b'').decode()
-        likes = int(data.get(b'metrics:likes', b'0'))
-        posts.append((post_id, likes))
-    _ = sorted(posts, key=lambda x: -x[1])[:5]
-    results["top_n_time"] = round(time.time() - t0, 4)
+    n_top = min(5, likes.size)
+    top = np.argpartition(-likes, n_top - 1)[:n_top] if n_top else likes[:0]
+    _ = [(post_ids[i], int(likes[i])) for i in top[np.argsort(-likes[top], kind='stable')]]
+    results["top_n_time"] = round(scan_time + time.time() - t0, 4)
 
     # Combined Aggregation
     t0 = time.time()
-    agg = {}
-    for _, data in table.scan(limit=1000):
-        platform = data.get(b'cf:platform', b'unknown').decode()
-        likes = int(data.get(b'metrics:likes', b'0'))
-        rate = float(data.get(b'metrics:engagement_rate', b'0'))
-        agg.setdefault(platform, []).append((likes, rate))
-    _ = {p: (sum(x for x, _ in vals), sum(y for _, y in vals)/len(vals)) for p, vals in agg.items()}
-    results["combined_aggregation_time"] = round(time.time() - t0, 4)
+    groups, codes = group_codes(platforms)
+    likes_sums = np.bincount(codes, weights=likes, minlength=len(groups)).astype(np.int64)
+    rate_avgs = np.bincount(codes, weights=rates, minlength=len(groups)) / np.bincount(codes, minlength=len(groups))
+    _ = dict(zip(groups, zip(likes_sums.tolist(), rate_avgs.tolist())))
+    results["combined_aggregation_time"] = round(scan_time + time.time() - t0, 4)
 
     # Count
     t0 = time.time()
     count = 0
-    for _, data in table.scan(limit=1000):
-        sentiment = data.get(b'cf:sentiment', b'').decode().lower()
-        if sentiment == 'negative':
-            count += 1
+    for _ in table.scan(row_stop=first_rows_stop, batch_size=1000, columns=[b'cf:sentiment'],
+                        filter=NEGATIVE_SENTIMENT_FILTER):
+        count += 1
     results["count_negative_sentiment_time"] = round(time.time() - t0, 4)
 
     loader.cleanup()
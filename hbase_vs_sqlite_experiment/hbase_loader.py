@@ -1,18 +1,79 @@
 import happybase
-import csv
 import time
+import os
 import logging
-import socket
 import json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 import threading
+import mmap
+import multiprocessing
+import io
+import zlib
+import subprocess
+import tempfile
 from queue import Queue
-from datetime import datetime
-import hashlib
+from collections import deque
+import numpy as np
+import pandas as pd
 
 # Logging configuration
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# CSV column -> (encoded HBase column, max stored length) for descriptive fields
+BASIC_COLUMNS = {
+    'Platform': (b'cf:platform', 50),
+    'Post ID': (b'cf:post_id', 50),
+    'Post Type': (b'cf:post_type', 50),
+    'Post Content': (b'cf:post_content', 500),
+    'Post Timestamp': (b'cf:post_timestamp', 50),
+    'Audience Age': (b'cf:audience_age', 50),
+    'Audience Gender': (b'cf:audience_gender', 50),
+    'Audience Location': (b'cf:audience_location', 100),
+    'Audience Interests': (b'cf:audience_interests', 200),
+    'Campaign ID': (b'cf:campaign_id', 50),
+    'Sentiment': (b'cf:sentiment', 50),
+    'Influencer ID': (b'cf:influencer_id', 50)
+}
+
+# CSV column -> encoded HBase column for numeric metrics
+METRIC_COLUMNS = {
+    'Likes': b'metrics:likes',
+    'Comments': b'metrics:comments',
+    'Shares': b'metrics:shares',
+    'Impressions': b'metrics:impressions',
+    'Reach': b'metrics:reach',
+    'Engagement Rate': b'metrics:engagement_rate'
+}
+
+NULL_TOKENS = frozenset(('nan', 'none', ''))
+
+# Text columns with few distinct values in the dataset (at most 243, Audience Location),
+# so the per-loader intern table stays at a few hundred entries
+LOW_CARDINALITY_COLUMNS = frozenset((
+    'Platform', 'Post Type', 'Audience Age', 'Audience Gender',
+    'Audience Location', 'Sentiment'
+))
+
+# Region boundaries matching the 2-hex-char row-key salt: 16 regions of equal share
+SPLIT_KEYS = [f'{i:x}0' for i in range(1, 16)]
+
+# Row counting only needs keys: one cell per row, value stripped server-side
+KEY_ONLY_FILTER = "FirstKeyOnlyFilter() AND KeyOnlyFilter()"
+
+# Column order of the TSV handed to ImportTsv (after HBASE_ROW_KEY)
+TSV_COLUMNS = [hbase_field for hbase_field, _ in BASIC_COLUMNS.values()] + list(METRIC_COLUMNS.values())
+
+# Pre-rendered two-hex-character salts, indexed by the low byte of the hash
+SALTS = [b'%02x' % i for i in range(256)]
+
+def row_key_salt(post_id):
+    """Two hex characters derived from the post id, spreading writes over 256 key ranges"""
+    return SALTS[zlib.crc32(post_id.encode()) & 0xff]
+
 class OptimizedHBaseLoader:
     """
     Optimized class for loading social media data into HBase
@@ -22,6 +83,10 @@ class OptimizedHBaseLoader:
         self.hbase_host = hbase_host
         self.hbase_port = hbase_port
         self.main_connection = None
+        # Long-lived connections shared by the writer threads (created on first use)
+        self.pool = None
+        # Encoded cell values of LOW_CARDINALITY_COLUMNS, kept across chunks
+        self._intern = {}
         self.performance_metrics = {
             'load_time': 0,
             'records_per_second': 0,
@@ -31,34 +96,70 @@ class OptimizedHBaseLoader:
         }
 
         # Conservative settings for stability
-        self.batch_size = 2000
-        self.max_workers = 3
+        self.batch_size = 5000
+        self.max_workers = 4
+        self.parse_processes = max(1, (os.cpu_count() or 1) - 1)
         self.connection_timeout = 30
         self.socket_timeout = 60
         self.max_retries = 3
-
-        # Thread control
-        self.batch_queue = Queue()
+        # Initial bulk import skips the write-ahead log; the table is rebuilt
+        # from the CSV anyway if a RegionServer dies mid-load
+        self.use_wal = False
+
+        # Framed transport + compact protocol (Thrift server started with -f -c)
+        self.thrift_transport = 'framed'
+        self.thrift_protocol = 'compact'
+
+        # Column-family compression; needs the snappy codec on the region servers,
+        # setup_optimized_table falls back to 'NONE' when the create is rejected
+        self.table_compression = 'SNAPPY'
+
+        # Progress lines are emitted at most once per interval (seconds)
+        self.progress_interval = 1.0
+        self._last_progress = 0.0
+
+        # Docker container running the HBase cluster at hbase_host (e.g. 'hbase-master'
+        # for a local docker setup). Needed by the HFile bulk load; when set, tables are
+        # also created pre-split through its `hbase shell`. None: Thrift only.
+        self.hbase_container = None
+
+        # Thread control; the bounded queue applies backpressure to the CSV reader
+        self.queue_size = 2 * self.max_workers
+        self.batch_queue = Queue(maxsize=self.queue_size)
         self.results_queue = Queue()
         self.stop_threads = threading.Event()
 
+    def _connection_settings(self):
+        """Keyword arguments shared by single and pooled Thrift connections"""
+        return {
+            'host': self.hbase_host,
+            'port': self.hbase_port,
+            'compat': '0.98',
+            # Per-connection socket timeout (ms) instead of a process-wide default
+            'timeout': self.socket_timeout * 1000,
+            'transport': self.thrift_transport,
+            'protocol': self.thrift_protocol,
+        }
+
+    def _open_connection(self):
+        """Open a new Thrift connection with the loader settings"""
+        connection = happybase.Connection(autoconnect=False, **self._connection_settings())
+        connection.open()
+        return connection
+
+    def get_pool(self):
+        """Return the connection pool, one connection per writer thread"""
+        if self.pool is None:
+            self.pool = happybase.ConnectionPool(size=self.max_workers, **self._connection_settings())
+        return self.pool
+
     def create_single_connection(self):
         """Create a single, stable connection"""
         start_time = time.time()
 
         try:
-            # Configure socket timeout
-            socket.setdefaulttimeout(self.socket_timeout)
-
-            self.main_connection = happybase.Connection(
-                host=self.hbase_host,
-                port=self.hbase_port,
-                autoconnect=False,
-                compat='0.98',
-            )
-
             # Test connection
-            self.main_connection.open()
+            self.main_connection = self._open_connection()
             tables = self.main_connection.tables()
             logger.info(f"✅ Connected to HBase. Available tables: {len(tables)}")
 
@@ -78,23 +179,17 @@ class OptimizedHBaseLoader:
                 self.main_connection.delete_table(table_name, disable=True)
                 time.sleep(3)
 
-            families = {
-                'cf': {
-                    'max_versions': 1,
-                    'compression': 'NONE',
-                    'bloom_filter_type': 'ROW',
-                    'block_cache_enabled': True
-                },
-                'metrics': {
-                    'max_versions': 1,
-                    'compression': 'NONE',
-                    'bloom_filter_type': 'ROW',
-                    'block_cache_enabled': True
-                }
-            }
-
-            self.main_connection.create_table(table_name, families)
-            logger.info(f"📊 Created HBase table: {table_name}")
+            # The shell starts a JVM, so only the first attempt goes through it
+            presplit = self.hbase_container is not None
+            try:
+                self._create_table(table_name, self.table_compression, presplit)
+            except Exception as e:
+                if self.table_compression == 'NONE':
+                    raise
+                # Region servers without the codec reject the table descriptor
+                logger.warning(f"⚠️ Creating {table_name} with {self.table_compression} "
+                               f"compression failed ({e}), retrying without compression")
+                self._create_table(table_name, 'NONE', presplit=False)
             time.sleep(2)
             return True
 
@@ -102,171 +197,432 @@ class OptimizedHBaseLoader:
             logger.error(f"❌ Error creating table: {e}")
             return False
 
-    def generate_simple_row_key(self, row, counter):
-        """Generate a simple, unique row key"""
-        platform = row.get('Platform', 'unknown')[:10]
-        post_id = str(row.get('Post ID', ''))
-        post_id_short = post_id[:8] if len(post_id) > 8 else post_id
-        row_key = f"{platform}_{post_id_short}_{counter:08d}"
-        return row_key
-
-    def prepare_simple_data(self, row):
-        """Prepare data in a simplified structure tailored to the CSV"""
-        data = {}
-        basic_mapping = {
-            'Platform': 'platform',
-            'Post ID': 'post_id',
-            'Post Type': 'post_type',
-            'Post Content': 'post_content',
-            'Post Timestamp': 'post_timestamp',
-            'Audience Age': 'audience_age',
-            'Audience Gender': 'audience_gender',
-            'Audience Location': 'audience_location',
-            'Audience Interests': 'audience_interests',
-            'Campaign ID': 'campaign_id',
-            'Sentiment': 'sentiment',
-            'Influencer ID': 'influencer_id'
-        }
+    def _create_table(self, table_name, compression, presplit):
+        """Create the table pre-split through the HBase shell if presplit and that
+        works, otherwise as a single region over Thrift"""
+        if presplit and self.create_presplit_table(table_name, compression):
+            logger.info(f"📊 Created HBase table: {table_name} ({len(SPLIT_KEYS) + 1} regions, {compression})")
+            return
 
-        for csv_field, hbase_field in basic_mapping.items():
-            val = str(row.get(csv_field, '')).strip()
-            if val and val.lower() not in ['nan', 'none', '']:
-                if csv_field == 'Post Content':
-                    val = val[:500]
-                elif csv_field == 'Audience Interests':
-                    val = val[:200]
-                elif csv_field == 'Audience Location':
-                    val = val[:100]
-                else:
-                    val = val[:50]
-                data[f'cf:{hbase_field}'] = val
-
-        metrics_mapping = {
-            'Likes': 'likes',
-            'Comments': 'comments',
-            'Shares': 'shares',
-            'Impressions': 'impressions',
-            'Reach': 'reach',
-            'Engagement Rate': 'engagement_rate'
+        families = {
+            'cf': {
+                'max_versions': 1,
+                'compression': compression,
+                'bloom_filter_type': 'ROW',
+                'block_cache_enabled': True
+            },
+            'metrics': {
+                'max_versions': 1,
+                'compression': compression,
+                'bloom_filter_type': 'ROW',
+                'block_cache_enabled': True
+            }
         }
 
-        for csv_field, hbase_field in metrics_mapping.items():
-            val = self._safe_convert(row.get(csv_field, '0'))
-            if val is not None:
-                data[f'metrics:{hbase_field}'] = str(val)
-
-        if not data:
-            return {}
-
-        byte_data = {}
-        for key, val in data.items():
-            if val and val.strip():
-                try:
-                    byte_data[key.encode('utf-8')] = val.encode('utf-8')
-                except Exception as e:
-                    logger.warning(f"⚠️ Encoding issue for {key}: {e}")
-        return byte_data
-
-    def _safe_convert(self, value):
-        """Safe conversion of values tailored to real data"""
-        if not value or str(value).strip().lower() in ['', 'nan', 'none', 'null']:
-            return 0
-        val_str = str(value).strip()
+        self.main_connection.create_table(table_name, families)
+        logger.info(f"📊 Created HBase table: {table_name} ({compression})")
+
+    def create_presplit_table(self, table_name, compression):
+        """Create the table pre-split on SPLIT_KEYS through the HBase shell.
+
+        Thrift 1 createTable takes no split keys, so this goes through
+        `hbase shell` in hbase_container; returns False if that fails or the
+        table does not show up on the Thrift connection (another cluster).
+        """
+        family = (f"VERSIONS => 1, COMPRESSION => '{compression}', "
+                  f"BLOOMFILTER => 'ROW', BLOCKCACHE => true")
+        splits = ', '.join(f"'{key}'" for key in SPLIT_KEYS)
+        ddl = (f"create '{table_name}', {{NAME => 'cf', {family}}}, "
+               f"{{NAME => 'metrics', {family}}}, SPLITS => [{splits}]\n")
         try:
-            f = float(val_str)
-            if f.is_integer() and abs(f) < 2147483647:
-                return int(f)
-            return round(f, 2)
-        except ValueError:
-            logger.debug(f"Cannot convert '{val_str}' to number")
-            return 0
+            result = subprocess.run(['docker', 'exec', '-i', self.hbase_container, 'hbase', 'shell'],
+                                    input=ddl, text=True, capture_output=True, check=True)
+            # The 1.x shell exits 0 even when a command fails
+            if 'ERROR' in result.stdout:
+                raise RuntimeError(result.stdout.strip().splitlines()[-1])
+        except (OSError, subprocess.CalledProcessError, RuntimeError) as e:
+            logger.warning(f"⚠️ Pre-split create failed, falling back to a single region: {e}")
+            return False
+        if table_name.encode() not in self.main_connection.tables():
+            logger.warning(f"⚠️ Container {self.hbase_container} does not serve {self.hbase_host}, "
+                           f"falling back to a single region")
+            return False
+        return True
+
+    def prepare_chunk(self, df, start_counter):
+        """Prepare a whole CSV chunk at once, column by column.
+
+        Row keys are salt_platform_postid_counter. Numeric parsing is vectorized
+        with pandas and each text column is cleaned in a single pass over its values.
+        """
+        n = len(df)
+        platforms = df['Platform'].tolist() if 'Platform' in df else ['unknown'] * n
+        post_ids = df['Post ID'].tolist() if 'Post ID' in df else [''] * n
+        # Only a handful of platforms: encode each one's row-key component once
+        platform_keys = {platform: (platform or 'unknown')[:10].encode() for platform in set(platforms)}
+        row_keys = [b'%b_%b_%b_%08d' % (row_key_salt(post_id), platform_keys[platform],
+                                         post_id[:8].encode(), counter)
+                    for platform, post_id, counter in zip(platforms, post_ids,
+                                                          range(start_counter, start_counter + n))]
+
+        qualifiers = []
+        columns = []
+        for csv_field, (hbase_field, max_len) in BASIC_COLUMNS.items():
+            if csv_field not in df:
+                continue
+            qualifiers.append(hbase_field)
+            values = df[csv_field].tolist()
+            if csv_field in LOW_CARDINALITY_COLUMNS:
+                # Clean and encode each distinct value once, then look rows up
+                cache = self._intern.setdefault(csv_field, {})
+                cache.update({raw: b'' if (val := raw.strip()).lower() in NULL_TOKENS else val[:max_len].encode()
+                              for raw in set(values).difference(cache)})
+                columns.append([cache[raw] for raw in values])
+            else:
+                columns.append([b'' if (val := raw.strip()).lower() in NULL_TOKENS else val[:max_len].encode()
+                                for raw in values])
+
+        for csv_field, hbase_field in METRIC_COLUMNS.items():
+            if csv_field in df:
+                num = pd.to_numeric(df[csv_field], errors='coerce').fillna(0).to_numpy()
+            else:
+                num = np.zeros(n)
+            # Missing or non-numeric values become 0; integral values as int, the rest rounded
+            # ±inf is masked out first (num % 1 warns on it) and stays a rounded float
+            is_int = np.isfinite(num) & (np.abs(num) < 2147483647)
+            is_int[is_int] = num[is_int] % 1 == 0
+            qualifiers.append(hbase_field)
+            columns.append([b'%d' % val if integral else str(round(val, 2)).encode()
+                            for val, integral in zip(num.tolist(), is_int.tolist())])
+
+        # The list is built in one comprehension and handed to the writer as-is;
+        # ownership moves through the batch queue without copying
+        return [(row_key, data) for row_key, values in zip(row_keys, zip(*columns))
+                if (data := {q: v for q, v in zip(qualifiers, values) if v})]
+
+    def retry_delay(self, attempt):
+        """Backoff (seconds) before the given zero-based attempt"""
+        return 2 * attempt
+
+    def _attempt_batch(self, table, batch_data, batch_id, attempt):
+        """Make one write attempt for a batch and return its result"""
+        start_time = time.time()
+        success_count = 0
+        try:
+            try:
+                # Whole batch in one mutateRows call
+                with table.batch(batch_size=len(batch_data), transaction=False, wal=self.use_wal) as batch:
+                    for key, data in batch_data:
+                        batch.put(key, data)
+                success_count = len(batch_data)
+            except Exception as batch_err:
+                logger.warning(f"⚠️ Batch {batch_id} send error, retrying row by row: {batch_err}")
+                for key, data in batch_data:
+                    try:
+                        table.put(key, data, wal=self.use_wal)
+                        success_count += 1
+                    except Exception as single_err:
+                        logger.warning(f"⚠️ Error writing record {key}: {single_err}")
         except Exception as e:
-            logger.warning(f"Unexpected conversion error '{val_str}': {e}")
-            return 0
+            logger.warning(f"⚠️ Batch {batch_id} attempt {attempt + 1} failed: {e}")
 
-    def load_batch_with_retry(self, table_name, batch_data, batch_id):
-        """Load a batch with retry mechanism and exponential backoff"""
-        for attempt in range(self.max_retries):
-            try:
-                start_time = time.time()
-                if attempt > 0:
-                    logger.info(f"🔄 Batch {batch_id} - attempt {attempt + 1}")
-                    time.sleep(2 * attempt)
+        batch_time = time.time() - start_time
+        if success_count == 0:
+            if attempt == self.max_retries - 1:
+                logger.error(f"❌ Batch {batch_id} failed after {self.max_retries} attempts")
+            return {'success': False, 'batch_id': batch_id, 'records': 0, 'time': 0, 'attempt': attempt + 1}
 
-                table = self.main_connection.table(table_name)
-                success_count = 0
-                micro_size = min(500, len(batch_data))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"✅ Batch {batch_id}: {success_count}/{len(batch_data)} records in {batch_time:.2f}s")
+        return {'success': True, 'batch_id': batch_id, 'records': success_count, 'time': batch_time, 'attempt': attempt + 1}
 
-                for i in range(0, len(batch_data), micro_size):
-                    micro_batch = batch_data[i:i + micro_size]
-                    try:
-                        with table.batch(batch_size=len(micro_batch)) as batch:
-                            for key, data in micro_batch:
-                                batch.put(key, data)
-                        success_count += len(micro_batch)
-                    except Exception as micro_err:
-                        logger.warning(f"⚠️ Micro-batch {i//micro_size + 1} error: {micro_err}")
-                        for key, data in micro_batch:
-                            try:
-                                table.put(key, data)
-                                success_count += 1
-                            except Exception as single_err:
-                                logger.warning(f"⚠️ Error writing record {key}: {single_err}")
-
-                batch_time = time.time() - start_time
-                if success_count > 0:
-                    logger.info(f"✅ Batch {batch_id}: {success_count}/{len(batch_data)} records in {batch_time:.2f}s")
-                    return {'success': True, 'batch_id': batch_id, 'records': success_count, 'time': batch_time, 'attempt': attempt + 1}
-            except Exception as e:
-                logger.warning(f"⚠️ Batch {batch_id} attempt {attempt + 1} failed: {e}")
-                if attempt == self.max_retries - 1:
-                    logger.error(f"❌ Batch {batch_id} failed after {self.max_retries} attempts")
-        return {'success': False, 'batch_id': batch_id, 'records': 0, 'time': 0, 'attempt': self.max_retries}
+    def load_batch_with_retry(self, table_name, batch_data, batch_id):
+        """Load a batch, sleeping between attempts (used by the sequential load)"""
+        table = self.main_connection.table(table_name)
+        for attempt in range(self.max_retries):
+            if attempt > 0:
+                logger.info(f"🔄 Batch {batch_id} - attempt {attempt + 1}")
+                time.sleep(self.retry_delay(attempt))
+            result = self._attempt_batch(table, batch_data, batch_id, attempt)
+            if result['success']:
+                break
+        return result
 
     def load_data_sequential(self, csv_file_path, table_name='social_media_optimized'):
         """Sequential data load—more stable than multithreaded"""
         logger.info("🚀 Starting sequential load to HBase...")
         start_time = time.time()
+        self._last_progress = start_time
         total_records = 0
         successful_records = 0
         batch_count = 0
-        current_batch = []
 
         try:
-            with open(csv_file_path, 'r', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                logger.info(f"📋 CSV columns: {reader.fieldnames}")
-
-                for idx, row in enumerate(reader):
-                    total_records += 1
-                    row_key = self.generate_simple_row_key(row, idx)
-                    data = self.prepare_simple_data(row)
-                    if data:
-                        current_batch.append((row_key, data))
-
-                    if len(current_batch) >= self.batch_size:
-                        batch_count += 1
-                        result = self.load_batch_with_retry(table_name, current_batch, batch_count)
-                        if result['success']:
-                            successful_records += result['records']
-                            self.performance_metrics['batch_times'].append(result['time'])
-                        current_batch = []
-                        if batch_count % 5 == 0:
-                            elapsed = time.time() - start_time
-                            rate = successful_records / elapsed if elapsed > 0 else 0
-                            logger.info(f"📊 Progress: {successful_records:,}/{total_records:,} records, {rate:.1f} rec/s")
+            chunks = pd.read_csv(csv_file_path, chunksize=self.batch_size, dtype=str,
+                                 na_filter=False, encoding='utf-8', memory_map=True)
+            for chunk in chunks:
+                if batch_count == 0:
+                    logger.info(f"📋 CSV columns: {list(chunk.columns)}")
+
+                current_batch = self.prepare_chunk(chunk, total_records)
+                total_records += len(chunk)
+                if not current_batch:
+                    continue
+
+                batch_count += 1
+                result = self.load_batch_with_retry(table_name, current_batch, batch_count)
+                if result['success']:
+                    successful_records += result['records']
+                    self.performance_metrics['batch_times'].append(result['time'])
+                self._log_progress(successful_records, total_records, start_time)
 
+        except Exception as e:
+            logger.error(f"❌ Error during load: {e}")
+            return False
+
+        self._report_load(total_records, successful_records, batch_count, time.time() - start_time)
+        return successful_records > 0
+
+    def _log_progress(self, successful_records, total_records, start_time):
+        """Log load progress, throttled to one line per progress_interval"""
+        now = time.time()
+        if now - self._last_progress < self.progress_interval or not logger.isEnabledFor(logging.INFO):
+            return
+        self._last_progress = now
+        elapsed = now - start_time
+        rate = successful_records / elapsed if elapsed > 0 else 0
+        logger.info(f"📊 Progress: {successful_records:,}/{total_records:,} records, {rate:.1f} rec/s")
+
+    def _batch_worker(self, table_name):
+        """Send batches from the queue over a pooled connection until a None sentinel"""
+        try:
+            # Thrift clients are not thread-safe, so every worker holds one pooled connection
+            with self.get_pool().connection(timeout=self.connection_timeout) as connection:
+                self._consume_batches(table_name, connection)
+        except Exception as e:
+            logger.error(f"❌ Worker could not connect to HBase: {e}")
+            self._consume_batches(table_name, None)
+
+    def _consume_batches(self, table_name, connection):
+        """Load queued batches until the None sentinel; fail them all without a connection.
+
+        A failed attempt is not retried in place: a timer puts the batch back on
+        the queue after the backoff, so this worker moves on to the next batch.
+        The queue item stays unfinished until then, which keeps
+        batch_queue.join() in _run_pipeline waiting for the retry.
+        """
+        table = connection.table(table_name) if connection else None
+        while True:
+            item = self.batch_queue.get()
+            if item is None:
+                self.batch_queue.task_done()
+                break
+            batch_id, batch_data, attempt = item
+            if table is None:
+                result = {'success': False, 'batch_id': batch_id, 'records': 0, 'time': 0, 'attempt': 0}
+            else:
+                result = self._attempt_batch(table, batch_data, batch_id, attempt)
+                if not result['success'] and attempt + 1 < self.max_retries:
+                    logger.info(f"🔄 Batch {batch_id} - attempt {attempt + 2} scheduled")
+                    retry = threading.Timer(self.retry_delay(attempt + 1), self._requeue_batch,
+                                            args=(batch_id, batch_data, attempt + 1))
+                    retry.daemon = True
+                    retry.start()
+                    continue
+            self.results_queue.put(result)
+            self.batch_queue.task_done()
+
+    def _requeue_batch(self, batch_id, batch_data, attempt):
+        """Timer callback: hand a failed batch back to the writers"""
+        self.batch_queue.put((batch_id, batch_data, attempt))
+        self.batch_queue.task_done()
+
+    def _iter_csv_batches(self, csv_file_path):
+        """Yield (rows read, prepared batch) for consecutive pandas CSV chunks"""
+        total_records = 0
+        chunks = pd.read_csv(csv_file_path, chunksize=self.batch_size, dtype=str,
+                             na_filter=False, encoding='utf-8', memory_map=True)
+        for chunk in chunks:
+            if total_records == 0:
+                logger.info(f"📋 CSV columns: {list(chunk.columns)}")
+            yield len(chunk), self.prepare_chunk(chunk, total_records)
+            total_records += len(chunk)
+
+    def _iter_mmap_batches(self, csv_file_path):
+        """Yield (rows read, prepared batch) from segments parsed in worker processes.
+
+        The memory-mapped file is cut at line boundaries into one byte range per
+        batch_size lines, so this path assumes no quoted field spans several
+        lines (true for the social media CSV).
+        """
+        with open(csv_file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            header_end = mm.find(b'\n') + 1
+            size = len(mm)
+
+            segments = []
+            start = header_end
+            start_counter = 0
+            while start < size:
+                end = start
+                rows = 0
+                while rows < self.batch_size and end < size:
+                    newline = mm.find(b'\n', end)
+                    end = size if newline == -1 else newline + 1
+                    rows += 1
+                segments.append((csv_file_path, header_end, start, end, start_counter))
+                start_counter += rows
+                start = end
+
+        logger.info(f"📋 Parsing {len(segments)} CSV segments in {self.parse_processes} processes")
+        # Only a couple of segments per process are in flight, so prepared batches
+        # wait in the workers, not here, while the bounded batch_queue is full
+        window = 2 * self.parse_processes
+        with multiprocessing.Pool(self.parse_processes) as pool:
+            pending = deque()
+            for segment in segments:
+                pending.append(pool.apply_async(_prepare_csv_segment, (segment,)))
+                if len(pending) >= window:
+                    yield pending.popleft().get()
+            while pending:
+                yield pending.popleft().get()
+
+    def load_data_pipelined(self, csv_file_path, table_name='social_media_optimized'):
+        """Pipelined load: the main thread parses and prepares CSV chunks
+        while max_workers threads send them to HBase"""
+        logger.info(f"🚀 Starting pipelined load to HBase with {self.max_workers} workers...")
+        return self._run_pipeline(self._iter_csv_batches(csv_file_path), table_name)
+
+    def load_data_mmap(self, csv_file_path, table_name='social_media_optimized'):
+        """Pipelined load with the CSV memory-mapped and parsed by parse_processes
+        processes in parallel, while max_workers threads send batches to HBase"""
+        logger.info(f"🚀 Starting mmap load to HBase with {self.parse_processes} parsers "
+                    f"and {self.max_workers} workers...")
+        return self._run_pipeline(self._iter_mmap_batches(csv_file_path), table_name)
+
+    def _run_pipeline(self, batches, table_name):
+        """Feed (rows read, batch) pairs to the writer threads and report the load"""
+        start_time = time.time()
+        self._last_progress = start_time
+        total_records = 0
+        successful_records = 0
+        batch_count = 0
+        load_ok = True
+
+        try:
+            # Created up front: the pool opens a first connection to fail fast
+            self.get_pool()
+        except Exception as e:
+            logger.error(f"❌ Error connecting to HBase: {e}")
+            return False
+
+        workers = [threading.Thread(target=self._batch_worker, args=(table_name,), daemon=True)
+                   for _ in range(self.max_workers)]
+        for worker in workers:
+            worker.start()
+
+        try:
+            for rows_read, current_batch in batches:
+                total_records += rows_read
                 if current_batch:
                     batch_count += 1
-                    result = self.load_batch_with_retry(table_name, current_batch, batch_count)
-                    if result['success']:
-                        successful_records += result['records']
+                    self.batch_queue.put((batch_count, current_batch, 0))
+                successful_records += self._collect_results()
+                self._log_progress(successful_records, total_records, start_time)
 
         except Exception as e:
             logger.error(f"❌ Error during load: {e}")
+            load_ok = False
+        finally:
+            # Wait for scheduled retries before stopping the writers
+            self.batch_queue.join()
+            for _ in workers:
+                self.batch_queue.put(None)
+            for worker in workers:
+                worker.join()
+
+        successful_records += self._collect_results()
+
+        if not load_ok:
             return False
 
-        total_time = time.time() - start_time
+        self._report_load(total_records, successful_records, batch_count, time.time() - start_time)
+        return successful_records > 0
+
+    def _collect_results(self):
+        """Record finished batch results and return how many records they loaded"""
+        records = 0
+        while not self.results_queue.empty():
+            result = self.results_queue.get()
+            if result['success']:
+                records += result['records']
+                self.performance_metrics['batch_times'].append(result['time'])
+        return records
+
+    def export_tsv(self, csv_file_path, tsv_path):
+        """Write prepared rows as TSV: row key, then TSV_COLUMNS (empty when missing)"""
+        count = 0
+        with open(tsv_path, 'wb') as out:
+            for _, batch in self._iter_csv_batches(csv_file_path):
+                lines = []
+                for row_key, data in batch:
+                    values = [data.get(column, b'').replace(b'\t', b' ').replace(b'\n', b' ')
+                              for column in TSV_COLUMNS]
+                    lines.append(b'\t'.join([row_key] + values))
+                out.write(b'\n'.join(lines) + b'\n')
+                count += len(lines)
+        return count
+
+    def load_data_bulk_hfile(self, csv_file_path, table_name='social_media_optimized'):
+        """Bulk load without Thrift: ImportTsv writes HFiles, completebulkload moves them in.
+
+        Unlike the Thrift path, missing values become empty cells (HBase 1.2
+        ImportTsv cannot skip empty columns).
+        """
+        logger.info("🚀 Starting HFile bulk load to HBase...")
+        if self.hbase_container is None:
+            logger.error("❌ HFile bulk load needs hbase_container (the HBase docker container)")
+            return False
+        start_time = time.time()
+        # The TSV is a full copy of the dataset: keep it out of the working
+        # directory and remove it (and the container copy) after the load
+        tmp_dir = tempfile.TemporaryDirectory()
+        local_tsv = os.path.join(tmp_dir.name, f'{table_name}.tsv')
+        container_tsv = f'/tmp/{table_name}.tsv'
+        hdfs_input = f'/tmp/{table_name}_input'
+        hfile_dir = f'/tmp/hfiles/{table_name}'
+        columns = ','.join(['HBASE_ROW_KEY'] + [column.decode('utf-8') for column in TSV_COLUMNS])
+        in_container = ['docker', 'exec', self.hbase_container]
+
+        steps = [
+            ['docker', 'cp', local_tsv, f'{self.hbase_container}:{container_tsv}'],
+            in_container + ['hdfs', 'dfs', '-mkdir', '-p', hdfs_input],
+            in_container + ['hdfs', 'dfs', '-put', '-f', container_tsv, hdfs_input],
+            in_container + ['rm', '-f', container_tsv],
+            in_container + ['hdfs', 'dfs', '-rm', '-r', '-f', hfile_dir],
+            in_container + ['hbase', 'org.apache.hadoop.hbase.mapreduce.ImportTsv',
+                            f'-Dimporttsv.columns={columns}', f'-Dimporttsv.bulk.output={hfile_dir}',
+                            table_name, hdfs_input],
+            in_container + ['hbase', 'org.apache.hadoop.hbase.mapreduce.LoadIncrementalHFiles',
+                            hfile_dir, table_name],
+        ]
+
+        try:
+            total_records = self.export_tsv(csv_file_path, local_tsv)
+            logger.info(f"📝 Wrote {total_records:,} rows to {local_tsv}")
+            for command in steps:
+                logger.info(f"⚙️ {' '.join(command)}")
+                subprocess.run(command, check=True)
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.error(f"❌ Bulk load failed: {e}")
+            return False
+        finally:
+            tmp_dir.cleanup()
+
+        self._report_load(total_records, total_records, 1, time.time() - start_time)
+        return total_records > 0
+
+    def _report_load(self, total_records, successful_records, batch_count, total_time):
+        """Store load metrics and log the summary report"""
         self.performance_metrics.update({
             'load_time': total_time,
             'total_records': total_records,
@@ -287,26 +643,25 @@ class OptimizedHBaseLoader:
         logger.info(f"📦 Number of batches: {batch_count}")
         logger.info("="*60)
 
-        return successful_records > 0
-
     def verify_data_simple(self, table_name='social_media_optimized', sample_size=5):
         """Simple verification of loaded data—structure-aware"""
         logger.info("🔍 Verifying data...")
         try:
             table = self.main_connection.table(table_name)
             count = 0
+            decode = bytes.decode
             logger.info("📋 Sample of loaded data:")
 
             for key, data in table.scan(limit=sample_size):
                 count += 1
-                row_key = key.decode('utf-8')
+                row_key = decode(key, 'utf-8', 'replace')
                 logger.info(f"\n📝 Record {count}: {row_key}")
                 cf_data = {}
                 metrics_data = {}
 
                 for k, v in data.items():
-                    col = k.decode('utf-8')
-                    val = v.decode('utf-8')
+                    col = decode(k, 'utf-8', 'replace')
+                    val = decode(v, 'utf-8', 'replace')
                     if col.startswith('cf:'):
                         cf_data[col] = val
                     elif col.startswith('metrics:'):
@@ -322,14 +677,7 @@ class OptimizedHBaseLoader:
                         logger.info(f"      {k}: {v}")
 
             logger.info("\n📊 Counting records in table...")
-            total_count = 0
-            for _ in table.scan():
-                total_count += 1
-                if total_count % 1000 == 0:
-                    logger.info(f"   Counted: {total_count:,}")
-                if total_count >= 10000:
-                    logger.info(f"   Stopped counting at {total_count:,} records")
-                    break
+            total_count = sum(1 for _ in table.scan(batch_size=5000, filter=KEY_ONLY_FILTER))
             logger.info(f"\n✅ Verification complete:")
             logger.info(f"   📋 Checked sample: {count} records")
             logger.info(f"   📊 Counted in table: {total_count:,} records")
@@ -340,18 +688,46 @@ class OptimizedHBaseLoader:
             return False
 
     def cleanup(self):
-        """Close the connection"""
+        """Close the connection and the pooled writer connections"""
         if self.main_connection:
             try:
                 self.main_connection.close()
                 logger.info("🔒 Connection to HBase closed")
             except:
                 pass
+        if self.pool is not None:
+            # ConnectionPool has no close(); once the writers are done every
+            # connection is back in its queue
+            while not self.pool._queue.empty():
+                try:
+                    self.pool._queue.get_nowait().close()
+                except:
+                    pass
+            self.pool = None
+            logger.info("🔒 HBase connection pool closed")
 
     def get_performance_report(self):
         """Return performance report"""
         return self.performance_metrics
 
+    def save_performance_report(self, path):
+        """Write the performance report as indented JSON (orjson when installed)"""
+        report = self.get_performance_report()
+        if orjson is not None:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(path, 'w') as f:
+                json.dump(report, f, indent=2)
+
+def _prepare_csv_segment(segment):
+    """Parse one byte range of the CSV in a worker process: (rows read, prepared batch)"""
+    csv_file_path, header_end, start, end, start_counter = segment
+    with open(csv_file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        data = io.BytesIO(mm[:header_end] + mm[start:end])
+    df = pd.read_csv(data, dtype=str, na_filter=False, encoding='utf-8')
+    return len(df), OptimizedHBaseLoader().prepare_chunk(df, start_counter)
+
 def run_base_loading():
     """Example usage of the stable loader"""
     csv_file_path = '../social_media_engagement_data.csv'
@@ -363,11 +739,9 @@ def run_base_loading():
             return
         if not loader.setup_optimized_table(table_name):
             return
-        if loader.load_data_sequential(csv_file_path, table_name):
+        if loader.load_data_pipelined(csv_file_path, table_name):
             loader.verify_data_simple(table_name)
-            report = loader.get_performance_report()
-            with open('hbase_stable_report.json', 'w') as f:
-                json.dump(report, f, indent=2)
+            loader.save_performance_report('hbase_stable_report.json')
             logger.info("✅ Loading completed successfully!")
         else:
             logger.error("❌ Loading failed")
@@ -1,8 +1,44 @@
 import json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+import functools
+import os
+import sys
+import numpy as np
+import matplotlib
+
+# Without a display (CI, ssh) render straight to files instead of opening windows
+HEADLESS = sys.platform.startswith('linux') and not os.environ.get('DISPLAY')
+if HEADLESS:
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 
+BENCHMARK_RESULTS = 'benchmark_results.json'
+HBASE_REPORT = 'hbase_stable_report.json'
+SQLITE_REPORT = 'sqlite_basic_report.json'
+
+@functools.lru_cache(maxsize=None)
+def load_report(path):
+    """Parse a JSON result file once (orjson when installed)"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path) as f:
+        return json.load(f)
+
+def show_or_close(fig):
+    """Show the figure interactively, or just release it when headless"""
+    if HEADLESS:
+        plt.close(fig)
+    else:
+        plt.show()
+
 # --- Load Time Plot ---
-def plot_load_times(hbase_load, sqlite_load):
+def plot_load_times(hbase_load=None, sqlite_load=None):
+    hbase_load = hbase_load or load_report(HBASE_REPORT)
+    sqlite_load = sqlite_load or load_report(SQLITE_REPORT)
     labels = ['HBase', 'SQLite']
     load_times = [hbase_load['load_time'], sqlite_load['load_time']]
     rps = [hbase_load['records_per_second'], sqlite_load['records_per_second']]
@@ -22,18 +58,19 @@ def plot_load_times(hbase_load, sqlite_load):
     # Save the figure
     fig.savefig('load_times.png')
 
-    plt.show()
+    show_or_close(fig)
 
 # --- Benchmark Performance Plot ---
-def plot_benchmark_times(benchmark):
+def plot_benchmark_times(benchmark=None):
+    benchmark = benchmark or load_report(BENCHMARK_RESULTS)
     categories = list(benchmark['sqlite'].keys())
-    sqlite_times = [benchmark['sqlite'][k] for k in categories]
-    hbase_times = [benchmark['hbase'][k] for k in categories]
+    sqlite_times = np.fromiter((benchmark['sqlite'][k] for k in categories), dtype=np.float64, count=len(categories))
+    hbase_times = np.fromiter((benchmark['hbase'][k] for k in categories), dtype=np.float64, count=len(categories))
 
-    x = range(len(categories))
-    plt.figure(figsize=(12, 6))
-    plt.bar([i - 0.2 for i in x], sqlite_times, width=0.4, label='SQLite', color='orange')
-    plt.bar([i + 0.2 for i in x], hbase_times, width=0.4, label='HBase', color='blue')
+    x = np.arange(len(categories))
+    fig = plt.figure(figsize=(12, 6))
+    plt.bar(x - 0.2, sqlite_times, width=0.4, label='SQLite', color='orange')
+    plt.bar(x + 0.2, hbase_times, width=0.4, label='HBase', color='blue')
 
     plt.xticks(ticks=x, labels=categories, rotation=45, ha='right')
     plt.ylabel('Time (s)')
@@ -44,23 +81,15 @@ def plot_benchmark_times(benchmark):
     # Save the figure
     plt.savefig('benchmark_times.png')
 
-    plt.show()
+    show_or_close(fig)
 
 # Run plots
 
 def run_visualizations():
-     # Load data
-    with open('benchmark_results.json') as f:
-        benchmark = json.load(f)
-
-    with open('hbase_stable_report.json') as f:
-        hbase_load = json.load(f)
-
-    with open('sqlite_basic_report.json') as f:
-        sqlite_load = json.load(f)
     print("Generating visualizations...")
-    plot_load_times(hbase_load, sqlite_load)
-    plot_benchmark_times(benchmark)
+    # Each plot loads only the result files it needs
+    plot_load_times()
+    plot_benchmark_times()
     print("Visualizations generated successfully.")
 
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
 import happybase
 import csv
 
-connection = happybase.Connection(host='0.0.0.0', port=9090)
+connection = happybase.Connection(host='0.0.0.0', port=9090, transport='framed', protocol='compact')
 table_name = 'social_media'
 
 families = {'cf': dict()}
@@ -10,16 +10,23 @@ if table_name.encode() not in connection.tables():
 
 table = connection.table(table_name)
 
-with open('social_media_engagement_data.csv', newline='') as csvfile:
-    reader = csv.DictReader(csvfile)
-    for row in reader:
-        row_key = row['Post ID']
-        data = {f'cf:{k}': v for k, v in row.items() if k != 'Post ID'}
-        table.put(row_key, {k.encode(): v.encode() for k, v in data.items()})
+# 1 MiB read buffer instead of the 8 KiB default; newline='' leaves line endings to csv
+with open('social_media_engagement_data.csv', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+    reader = csv.reader(csvfile)
+    header = next(reader)
+    key_idx = header.index('Post ID')
+    # Column qualifiers are encoded once, rows are read as plain lists
+    columns = [(i, f'cf:{name}'.encode()) for i, name in enumerate(header) if i != key_idx]
+    # Puts are buffered and sent as one mutateRows call per 5000 rows
+    with table.batch(batch_size=5000) as batch:
+        for row in reader:
+            # Empty fields are not stored, as in the experiment loader
+            batch.put(row[key_idx].encode(), {col: row[i].encode() for i, col in columns if row[i]})
 
 print("✅ Data inserted successfully.")
 
-count = sum(1 for _ in table.scan())
+# Key-only scan: each row comes back as its key and one empty cell
+count = sum(1 for _ in table.scan(batch_size=10000, filter="FirstKeyOnlyFilter() AND KeyOnlyFilter()"))
 print(f"📊 Total rows in 'social_media': {count}")
 
 connection.close()
\ No newline at end of file
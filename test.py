@@ -3,7 +3,7 @@ import happybase
 class HBaseClient:
     def __init__(self, host='localhost', port=9090):
         try:
-            self.connection = happybase.Connection(host=host, port=port)
+            self.connection = happybase.Connection(host=host, port=port, transport='framed', protocol='compact')
             print(f"Connected to HBase at {host}:{port}")
         except Exception as e:
             print(f"Failed to connect to HBase: {e}")